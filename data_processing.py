@@ -1,6 +1,8 @@
 # data_processing.py
 
 from tqdm import tqdm
+import numpy as np
+import pandas as pd
 import time
 
 def process_data(data, progress=True):
@@ -34,3 +36,135 @@ def load_data_from_file(file_path):
     except Exception as e:
         print(f"Error loading data from file: {e}")
         return [], []
+
+
+def parse_timestamps(values):
+    """
+    Parse ISO timestamps or epoch values into a datetime64 array.
+    Epoch values are read as seconds, milliseconds, microseconds or
+    nanoseconds depending on their magnitude. All-digit values of the form
+    YYYYMMDD are read as ISO basic dates rather than epoch seconds.
+    """
+    series = pd.Series(np.asarray(values))
+    if series.empty:
+        return np.array([], dtype='datetime64[ns]')
+    strings = series.astype(str).str.strip()
+    if strings.str.fullmatch(r'\d{8}').all():
+        basic_dates = pd.to_datetime(strings, format='%Y%m%d', errors='coerce')
+        if basic_dates.notna().all():
+            return basic_dates.to_numpy(dtype='datetime64[ns]')
+    numeric = pd.to_numeric(series, errors='coerce')
+    if numeric.notna().all():
+        magnitude = numeric.abs().max()
+        if magnitude < 1e11:
+            unit = 's'
+        elif magnitude < 1e14:
+            unit = 'ms'
+        elif magnitude < 1e17:
+            unit = 'us'
+        else:
+            unit = 'ns'
+        return pd.to_datetime(numeric, unit=unit).to_numpy(dtype='datetime64[ns]')
+    parsed = pd.to_datetime(strings, format='ISO8601', utc=True)
+    return parsed.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+
+def resample_series(x, y, interval, how='mean'):
+    """
+    Resample a time series onto fixed intervals (e.g. '1min', '1h').
+    Supported aggregations are mean, min, max and count. Empty intervals
+    are dropped.
+    """
+    x = np.asarray(x, dtype='datetime64[ns]')
+    y = np.asarray(y, dtype=float)
+    if len(x) == 0:
+        return x, y
+    step = pd.to_timedelta(interval).value
+    if step <= 0:
+        raise ValueError(f"Resampling interval must be positive: {interval}")
+    ticks = x.astype(np.int64)
+    if np.any(ticks[1:] < ticks[:-1]):
+        order = np.argsort(ticks, kind='stable')
+        ticks, y = ticks[order], y[order]
+    bin_ids = ticks // step
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bin_ids)) + 1))
+    counts = np.diff(np.append(starts, len(y)))
+    if how == 'mean':
+        values = np.add.reduceat(y, starts) / counts
+    elif how == 'min':
+        values = np.minimum.reduceat(y, starts)
+    elif how == 'max':
+        values = np.maximum.reduceat(y, starts)
+    elif how == 'count':
+        values = counts.astype(float)
+    else:
+        raise ValueError(f"Unsupported aggregation: {how}")
+    return (bin_ids[starts] * step).astype('datetime64[ns]'), values
+
+def rolling_stats(y, window, percentiles=(5, 95)):
+    """
+    Compute trailing rolling mean, standard deviation and percentiles.
+    Mean and std use cumulative sums that restart every block, centred on
+    the block's own mean, so rounding error stays bounded on long trending
+    series. Percentiles use pandas' streaming window. Values are NaN for the
+    first window - 1 samples and for any window containing a NaN.
+    """
+    if window < 1:
+        raise ValueError("Rolling window must be a positive integer.")
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    missing = np.isnan(y)
+    block_size = max(1024, 4 * window)
+    for start in range(window - 1, n, block_size):
+        stop = min(start + block_size, n)
+        segment = y[start - window + 1:stop]
+        segment_missing = missing[start - window + 1:stop]
+        if segment_missing.all():
+            continue
+        reference = segment[~segment_missing].mean()
+        centered = np.where(segment_missing, 0.0, segment - reference)
+        csum = np.concatenate(([0.0], np.cumsum(centered)))
+        csq = np.concatenate(([0.0], np.cumsum(centered ** 2)))
+        cmissing = np.concatenate(([0], np.cumsum(segment_missing)))
+        sums = csum[window:] - csum[:-window]
+        sq_sums = csq[window:] - csq[:-window]
+        complete = cmissing[window:] == cmissing[:-window]
+        mean[start:stop] = np.where(complete, sums / window + reference, np.nan)
+        if window > 1:
+            variance = (sq_sums - sums ** 2 / window) / (window - 1)
+            std[start:stop] = np.where(complete, np.sqrt(np.clip(variance, 0, None)), np.nan)
+    rolling = pd.Series(y).rolling(window)
+    return {
+        'mean': mean,
+        'std': std,
+        'percentiles': {p: rolling.quantile(p / 100).to_numpy() for p in percentiles},
+    }
+
+def process_time_series(x, y, interval=None, how='mean', window=None, band='percentile',
+                        percentiles=(5, 95)):
+    """
+    Parse, resample and summarise a time series for plotting.
+    Returns X as datetime64, Y as floats, and a list of rolling bands
+    ({'x', 'lower', 'upper', 'center', 'label'}) for line and area graphs.
+    """
+    x = parse_timestamps(x)
+    y = np.asarray(y, dtype=float)
+    if len(x) != len(y):
+        raise ValueError("X and Y values must have the same length.")
+    if interval:
+        x, y = resample_series(x, y, interval, how=how)
+    bands = []
+    if window:
+        stats = rolling_stats(y, window, percentiles=percentiles)
+        if band == 'std':
+            lower = stats['mean'] - stats['std']
+            upper = stats['mean'] + stats['std']
+            label = f"Rolling mean +/- 1 std (window {window})"
+        else:
+            low_p, high_p = min(percentiles), max(percentiles)
+            lower = stats['percentiles'][low_p]
+            upper = stats['percentiles'][high_p]
+            label = f"Rolling p{low_p}-p{high_p} (window {window})"
+        bands.append({'x': x, 'lower': lower, 'upper': upper, 'center': stats['mean'], 'label': label})
+    return x, y, bands
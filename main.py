@@ -1,6 +1,6 @@
 # main.py
 
-from data_processing import process_data, load_data_from_file
+from data_processing import process_data, load_data_from_file, process_time_series
 from plotting import (
     plot_heatmap,
     plot_combined_2d_graph,
@@ -23,6 +23,8 @@ from user_interface import (
     get_save_path,
     get_interactive_choice,
     get_kde_choice,
+    get_raster_options,
+    get_time_series_options,
 )
 import numpy as np
 import sys
@@ -33,13 +35,22 @@ def main():
         x_values = []
         y_values = []
         z_values = []  # For 3D graphs
+        bands = []  # Rolling-statistics bands per dataset
         labels = []
 
         if data_source == 'yes':
             file_path = input("Enter the file path: ").strip()
             x, y = load_data_from_file(file_path)
-            x_values.append(process_data(x))
-            y_values.append(process_data(y))
+            time_series = get_time_series_options()
+            if time_series is not None:
+                x, y, dataset_bands = process_time_series(x, y, **time_series)
+                x_values.append(x)
+                y_values.append(y)
+                bands.append(dataset_bands)
+            else:
+                x_values.append(process_data(x))
+                y_values.append(process_data(y))
+                bands.append([])
             labels.append("Dataset 1")
             z_values.append(None)  # No Z values unless specified
         else:
@@ -48,6 +59,7 @@ def main():
                 x_values.append(process_data(dataset['x']))
                 y_values.append(process_data(dataset['y']))
                 z_values.append(process_data(dataset['z']) if dataset['z'] else None)
+                bands.append([])
                 labels.append(dataset['label'])
 
         combine_choice = 'no'
@@ -81,6 +93,9 @@ def main():
             else:
                 kwargs['annotations'] = {}
 
+            if graph_type in ['line', 'area']:
+                kwargs['bands'] = [band for dataset_bands in bands for band in dataset_bands]
+
             if graph_type == 'heatmap':
                 matrix = get_heatmap_data()
                 save_path = get_save_path("Do you want to save the heatmap")
@@ -88,9 +103,10 @@ def main():
             elif graph_type == '3d':
                 z_label = get_input_with_default("Enter the name for the Z-axis", default='Z')
                 save_path = get_save_path("Do you want to save the combined 3D graph")
+                kwargs.update(get_raster_options(save_path))
                 plot_combined_3d_graph(
                     x_values, y_values, z_values, labels, x_label, y_label, z_label,
-                    save_path=save_path, interactive=interactive
+                    save_path=save_path, interactive=interactive, **kwargs
                 )
             elif graph_type == 'violin':
                 save_path = get_save_path("Do you want to save the violin plot")
@@ -110,6 +126,7 @@ def main():
                 )
             else:
                 save_path = get_save_path("Do you want to save the combined graph")
+                kwargs.update(get_raster_options(save_path))
                 plot_combined_2d_graph(
                     x_values, y_values, labels, x_label, y_label, graph_type,
                     save_path=save_path, interactive=interactive, **kwargs
@@ -140,9 +157,13 @@ def main():
                 else:
                     kwargs['annotations'] = {}
 
+                if graph_type in ['line', 'area']:
+                    kwargs['bands'] = bands[i]
+
                 if graph_type == '3d':
                     z_label = get_input_with_default("Enter the name for the Z-axis", default='Z')
                     save_path = get_save_path(f"Do you want to save the graph for Dataset {i + 1}")
+                    kwargs.update(get_raster_options(save_path))
                     plot_individual_graph(
                         x, y, z, labels[i], x_label, y_label, z_label, graph_type,
                         save_path=save_path, interactive=interactive, **kwargs
@@ -164,6 +185,7 @@ def main():
                     )
                 else:
                     save_path = get_save_path(f"Do you want to save the graph for Dataset {i + 1}")
+                    kwargs.update(get_raster_options(save_path))
                     plot_individual_graph(
                         x, y, z, labels[i], x_label, y_label, None, graph_type,
                         save_path=save_path, interactive=interactive, **kwargs
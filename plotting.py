@@ -2,15 +2,82 @@
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+import matplotlib.dates as mdates
+from matplotlib.collections import Collection, LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
 import os
 import sys
+import warnings
 
 # Import Plotly for interactive plots
 import plotly.express as px
 import plotly.graph_objects as go
 
+VECTOR_FORMATS = ['.svg', '.pdf', '.eps', '.ps']
+
+def format_file_size(num_bytes):
+    """
+    Format a byte count as a human-readable string.
+    """
+    for unit in ['B', 'KB', 'MB']:
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+def count_artist_elements(artist):
+    """
+    Count the markers or vertices an artist writes when saved as vector data.
+    """
+    if isinstance(artist, Line2D):
+        return len(artist.get_xdata())
+    if isinstance(artist, Collection):
+        vertices = sum(len(path.vertices) for path in artist.get_paths())
+        return max(len(artist.get_offsets()), vertices)
+    return 1
+
+def rasterize_dense_artists(fig, threshold):
+    """
+    Mark data artists with more than `threshold` elements as rasterized.
+    Axes, labels, legends and annotations are left as vectors.
+    Returns the number of layers rasterized, counting an axes' patches as one.
+    """
+    rasterized = 0
+    for ax in fig.axes:
+        for artist in list(ax.lines) + list(ax.collections):
+            if count_artist_elements(artist) > threshold:
+                # mplot3d collections warn that rasterization is ignored, but
+                # they are rasterized by the vector backends all the same
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', message='Rasterization of .* will be ignored')
+                    artist.set_rasterized(True)
+                rasterized += 1
+        if len(ax.patches) > threshold:
+            for patch in ax.patches:
+                patch.set_rasterized(True)
+            rasterized += 1
+    return rasterized
+
+def save_figure(fig, save_path, **kwargs):
+    """
+    Save a figure, rasterizing dense data artists when writing a vector format.
+    Returns the size of the written file in bytes.
+    """
+    if os.path.splitext(save_path)[1].lower() in VECTOR_FORMATS:
+        threshold = kwargs.get('rasterize_threshold', 10000)
+        raster_dpi = kwargs.get('raster_dpi', 300)
+        if threshold is not None:
+            rasterized = rasterize_dense_artists(fig, threshold)
+            if rasterized:
+                print(f"Rasterized {rasterized} dense data layer(s) at {raster_dpi} dpi.")
+        fig.savefig(save_path, dpi=raster_dpi)
+    else:
+        fig.savefig(save_path)
+    return os.path.getsize(save_path)
+
 def plot_heatmap(data, save_path=None):
     """
     Plot a heatmap for matrix-like data.
@@ -34,6 +101,72 @@ def add_annotations(ax, x, y, annotations):
         mean_y = np.mean(y)
         ax.axhline(mean_y, color='red', linestyle='--', label=f"Mean = {mean_y:.2f}")
 
+def add_bands(ax, bands):
+    """
+    Draw shaded bands (e.g. rolling percentiles) with an optional center line.
+    """
+    for band in bands:
+        ax.fill_between(band['x'], band['lower'], band['upper'], color='gray', alpha=0.3, label=band['label'])
+        if band.get('center') is not None:
+            ax.plot(band['x'], band['center'], color='black', linestyle='--', linewidth=1, label="Rolling mean")
+
+def pack_ragged_series(x_values_list, y_values_list):
+    """
+    Pack a list of series into flat X and Y arrays plus an offsets array.
+    Series i occupies flat_x[offsets[i]:offsets[i + 1]].
+    """
+    lengths = np.array([min(len(x), len(y)) for x, y in zip(x_values_list, y_values_list)], dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if lengths.size == 0:
+        return np.empty(0), np.empty(0), offsets
+    flat_x = np.concatenate([np.asarray(x)[:n] for x, n in zip(x_values_list, lengths)])
+    flat_y = np.concatenate([np.asarray(y, dtype=float)[:n] for y, n in zip(y_values_list, lengths)])
+    return flat_x, flat_y, offsets
+
+def plot_many_series(ax, x_values_list, y_values_list, labels, graph_type, **kwargs):
+    """
+    Draw all series as a single LineCollection or PathCollection coloured by
+    series index, instead of one artist and legend entry per series.
+    Returns legend handles for the top-N series ranked by peak Y value.
+    """
+    flat_x, flat_y, offsets = pack_ragged_series(x_values_list, y_values_list)
+    if np.issubdtype(flat_x.dtype, np.datetime64):
+        flat_x = mdates.date2num(flat_x)
+        ax.xaxis_date()
+    lengths = np.diff(offsets)
+    n_series = len(lengths)
+    cmap = plt.get_cmap(kwargs.get('cmap', 'viridis'))
+    norm = mcolors.Normalize(vmin=0, vmax=max(n_series - 1, 1))
+    if graph_type == 'line':
+        points = np.column_stack((flat_x, flat_y))
+        segments = np.split(points, offsets[1:-1])
+        artist = LineCollection(segments, cmap=cmap, norm=norm, linewidths=kwargs.get('line_width', 0.5))
+        artist.set_array(np.arange(n_series))
+        ax.add_collection(artist)
+        ax.autoscale_view()
+    else:
+        series_index = np.repeat(np.arange(n_series), lengths)
+        artist = ax.scatter(flat_x, flat_y, c=series_index, cmap=cmap, norm=norm,
+                            marker='o', s=kwargs.get('marker_size', 4))
+    if kwargs.get('colorbar', True):
+        ax.figure.colorbar(artist, ax=ax, label='Series index')
+
+    handles = []
+    top_n = min(kwargs.get('legend_top_n', 0), n_series)
+    if top_n > 0:
+        peaks = np.full(n_series, -np.inf)
+        non_empty = lengths > 0
+        if non_empty.any():
+            peaks[non_empty] = np.fmax.reduceat(flat_y, offsets[:-1][non_empty])
+        peaks[np.isnan(peaks)] = -np.inf
+        for i in np.argsort(peaks)[::-1][:top_n]:
+            if graph_type == 'line':
+                handles.append(Line2D([], [], color=cmap(norm(i)), label=labels[i]))
+            else:
+                handles.append(Line2D([], [], color=cmap(norm(i)), marker='o', linestyle='', label=labels[i]))
+    return handles
+
 def plot_violin(x_values_list, y_values_list, labels, x_label, y_label,
                 save_path=None, interactive=False):
     """
@@ -119,49 +252,64 @@ def plot_combined_2d_graph(x_values_list, y_values_list, labels, x_label, y_labe
         ax.set_title("Combined Graph")
         ax.set_xlabel(x_label)
         ax.set_ylabel(y_label)
-        for i, (x, y) in enumerate(zip(x_values_list, y_values_list)):
-            current_color = f"C{i}"
-            marker = 'o' if graph_type in ['line', 'scatter'] else None
-            if graph_type == 'line':
-                ax.plot(x, y, marker=marker, linestyle='-', color=current_color, label=labels[i])
-            elif graph_type == 'scatter':
-                ax.scatter(x, y, color=current_color, marker=marker, label=labels[i])
-            elif graph_type == 'bar':
-                ax.bar(x, y, color=current_color, label=labels[i])
-            elif graph_type == 'area':
-                ax.fill_between(x, y, color=current_color, alpha=0.5, label=labels[i])
-            elif graph_type == 'histogram':
-                bins = kwargs.get('bins')
-                if bins is None:
-                    data = np.array(y)
-                    q25, q75 = np.percentile(data, [25, 75])
-                    bin_width = 2 * (q75 - q25) * len(data) ** (-1/3)
-                    bins = max(int((data.max() - data.min()) / bin_width), 1) if bin_width > 0 else len(data)
+        many_series = kwargs.get('many_series')
+        if many_series is None:
+            many_series = len(y_values_list) > kwargs.get('many_series_threshold', 100)
+        many_series = many_series and graph_type in ['line', 'scatter']
+        legend_handles = []
+        if many_series:
+            legend_handles = plot_many_series(ax, x_values_list, y_values_list, labels, graph_type, **kwargs)
+        else:
+            for i, (x, y) in enumerate(zip(x_values_list, y_values_list)):
+                current_color = f"C{i}"
+                marker = 'o' if graph_type in ['line', 'scatter'] else None
+                if graph_type == 'line':
+                    ax.plot(x, y, marker=marker, linestyle='-', color=current_color, label=labels[i])
+                elif graph_type == 'scatter':
+                    ax.scatter(x, y, color=current_color, marker=marker, label=labels[i])
+                elif graph_type == 'bar':
+                    ax.bar(x, y, color=current_color, label=labels[i])
+                elif graph_type == 'area':
+                    ax.fill_between(x, y, color=current_color, alpha=0.5, label=labels[i])
+                elif graph_type == 'histogram':
+                    bins = kwargs.get('bins')
+                    if bins is None:
+                        data = np.array(y)
+                        q25, q75 = np.percentile(data, [25, 75])
+                        bin_width = 2 * (q75 - q25) * len(data) ** (-1/3)
+                        bins = max(int((data.max() - data.min()) / bin_width), 1) if bin_width > 0 else len(data)
+                    else:
+                        bins = int(bins)
+                    ax.hist(y, bins=bins, color=current_color, edgecolor='black', label=labels[i], alpha=0.5, density=kwargs.get('include_kde', False))
+                    if kwargs.get('include_kde', False):
+                        sns.kdeplot(y, ax=ax, color=current_color)
+                elif graph_type == 'boxplot':
+                    ax.boxplot(y, patch_artist=True, boxprops=dict(facecolor=current_color), labels=[labels[i]])
+                    box_patch = mpatches.Patch(color=current_color, label=labels[i])
+                    ax.legend(handles=[box_patch])
                 else:
-                    bins = int(bins)
-                ax.hist(y, bins=bins, color=current_color, edgecolor='black', label=labels[i], alpha=0.5, density=kwargs.get('include_kde', False))
-                if kwargs.get('include_kde', False):
-                    sns.kdeplot(y, ax=ax, color=current_color)
-            elif graph_type == 'boxplot':
-                ax.boxplot(y, patch_artist=True, boxprops=dict(facecolor=current_color), labels=[labels[i]])
-                box_patch = mpatches.Patch(color=current_color, label=labels[i])
-                ax.legend(handles=[box_patch])
-            else:
-                print(f"Unsupported graph type: {graph_type}")
+                    print(f"Unsupported graph type: {graph_type}")
+        if graph_type in ['line', 'area']:
+            add_bands(ax, kwargs.get('bands', []))
         # Add annotations
         annotations = kwargs.get('annotations', {})
         if annotations:
             add_annotations(ax, x_values_list[0], y_values_list[0], annotations)
-        ax.legend()
+        if many_series:
+            handles = legend_handles + ax.get_legend_handles_labels()[0]
+            if handles:
+                ax.legend(handles=handles, loc=kwargs.get('legend_loc', 'upper right'))
+        else:
+            ax.legend()
         ax.grid(True)
         if save_path:
-            plt.savefig(save_path)
-            print(f"Combined graph saved to {save_path}")
+            size = save_figure(fig, save_path, **kwargs)
+            print(f"Combined graph saved to {save_path} ({format_file_size(size)})")
         else:
             plt.show()
 
 def plot_combined_3d_graph(x_values_list, y_values_list, z_values_list, labels,
-                           x_label, y_label, z_label, save_path=None, interactive=False):
+                           x_label, y_label, z_label, save_path=None, interactive=False, **kwargs):
     """
     Plot combined 3D graph for multiple datasets.
     """
@@ -191,8 +339,8 @@ def plot_combined_3d_graph(x_values_list, y_values_list, z_values_list, labels,
         ax.set_zlabel(z_label)
         ax.legend()
         if save_path:
-            plt.savefig(save_path)
-            print(f"Combined 3D graph saved to {save_path}")
+            size = save_figure(fig, save_path, **kwargs)
+            print(f"Combined 3D graph saved to {save_path} ({format_file_size(size)})")
         else:
             plt.show()
 
@@ -252,8 +400,8 @@ def plot_individual_graph(x, y, z, label, x_label, y_label, z_label, graph_type,
             ax.set_zlabel(z_label)
             ax.legend()
             if save_path:
-                plt.savefig(save_path)
-                print(f"Graph for {label} saved to {save_path}")
+                size = save_figure(fig, save_path, **kwargs)
+                print(f"Graph for {label} saved to {save_path} ({format_file_size(size)})")
             else:
                 plt.show()
         elif graph_type == 'violin':
@@ -300,6 +448,8 @@ def plot_individual_graph(x, y, z, label, x_label, y_label, z_label, graph_type,
                 ax.legend(handles=[box_patch])
             else:
                 print(f"Unsupported graph type: {graph_type}")
+            if graph_type in ['line', 'area']:
+                add_bands(ax, kwargs.get('bands', []))
             # Add annotations
             annotations = kwargs.get('annotations', {})
             if annotations:
@@ -307,7 +457,7 @@ def plot_individual_graph(x, y, z, label, x_label, y_label, z_label, graph_type,
             ax.legend()
             ax.grid(True)
             if save_path:
-                plt.savefig(save_path)
-                print(f"Graph for {label} saved to {save_path}")
+                size = save_figure(fig, save_path, **kwargs)
+                print(f"Graph for {label} saved to {save_path} ({format_file_size(size)})")
             else:
                 plt.show()
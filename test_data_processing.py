@@ -0,0 +1,48 @@
+# test_data_processing.py
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from data_processing import parse_timestamps, rolling_stats
+
+def exact_rolling(y, window):
+    windows = sliding_window_view(y, window)
+    return windows.mean(axis=1), windows.std(axis=1, ddof=1)
+
+def test_rolling_stats_precision_on_long_trending_series():
+    rng = np.random.default_rng(0)
+    n, window = 2_000_000, 10
+    series = {
+        'ramp': np.arange(n) * 0.01 + rng.normal(size=n),
+        'counter': 1e9 + np.cumsum(rng.integers(0, 100, size=n)).astype(float),
+        'drift': 20 + np.cumsum(rng.normal(scale=0.01, size=n)) + rng.normal(scale=0.1, size=n),
+    }
+    for name, y in series.items():
+        stats = rolling_stats(y, window, percentiles=())
+        mean, std = exact_rolling(y, window)
+        assert np.all(np.isnan(stats['mean'][:window - 1])), name
+        np.testing.assert_allclose(stats['mean'][window - 1:], mean, rtol=1e-9, err_msg=name)
+        np.testing.assert_allclose(stats['std'][window - 1:], std, rtol=1e-6, err_msg=name)
+
+def test_rolling_stats_nan_stays_local():
+    y = np.arange(100, dtype=float)
+    y[50] = np.nan
+    stats = rolling_stats(y, 5, percentiles=())
+    assert np.isnan(stats['std'][50:55]).all()
+    assert np.isfinite(stats['mean'][4:50]).all()
+    assert np.isfinite(stats['std'][55:]).all()
+
+def test_parse_timestamps_iso_basic_dates():
+    expected = np.array(['2024-01-01', '2024-01-02'], dtype='datetime64[ns]')
+    np.testing.assert_array_equal(parse_timestamps(['20240101', '20240102']), expected)
+    np.testing.assert_array_equal(parse_timestamps([20240101, 20240102]), expected)
+    np.testing.assert_array_equal(
+        parse_timestamps(['20240101T120000']),
+        np.array(['2024-01-01T12:00:00'], dtype='datetime64[ns]'),
+    )
+
+def test_parse_timestamps_epoch_and_iso():
+    expected = np.array(['2024-01-01T00:00:00', '2024-01-01T00:00:01'], dtype='datetime64[ns]')
+    np.testing.assert_array_equal(parse_timestamps(['1704067200', '1704067201']), expected)
+    np.testing.assert_array_equal(parse_timestamps(['1704067200000', '1704067201000']), expected)
+    np.testing.assert_array_equal(parse_timestamps(['2024-01-01T00:00:00Z', '2024-01-01 00:00:01']), expected)
@@ -0,0 +1,35 @@
+# test_plotting.py
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from plotting import pack_ragged_series, plot_many_series
+
+def test_pack_ragged_series_layout():
+    x_values_list = [[0, 1, 2], [], [5], [7, 8]]
+    y_values_list = [[10, 11, 12], [], [15], [17, 18]]
+    flat_x, flat_y, offsets = pack_ragged_series(x_values_list, y_values_list)
+    np.testing.assert_array_equal(offsets, [0, 3, 3, 4, 6])
+    np.testing.assert_array_equal(flat_x, [0, 1, 2, 5, 7, 8])
+    np.testing.assert_array_equal(flat_y, [10, 11, 12, 15, 17, 18])
+    for i, y in enumerate(y_values_list):
+        np.testing.assert_array_equal(flat_y[offsets[i]:offsets[i + 1]], y)
+
+def test_pack_ragged_series_empty():
+    flat_x, flat_y, offsets = pack_ragged_series([], [])
+    assert len(flat_x) == len(flat_y) == 0
+    np.testing.assert_array_equal(offsets, [0])
+
+def test_plot_many_series_top_n_ignores_nan():
+    y_values_list = [[1, np.nan, 2], [5, 6, 7], [np.nan, np.nan], [3, 100, np.nan], [], [0, 1]]
+    x_values_list = [list(range(len(y))) for y in y_values_list]
+    labels = ['a', 'b', 'all-nan', 'd', 'empty', 'f']
+    for graph_type in ['line', 'scatter']:
+        fig, ax = plt.subplots()
+        handles = plot_many_series(ax, x_values_list, y_values_list, labels, graph_type,
+                                   legend_top_n=len(labels))
+        assert [h.get_label() for h in handles][:4] == ['d', 'b', 'a', 'f']
+        assert set(h.get_label() for h in handles[4:]) == {'all-nan', 'empty'}
+        plt.close(fig)
@@ -1,6 +1,8 @@
 # user_interface.py
 
 import sys
+import pandas as pd
+from plotting import VECTOR_FORMATS
 
 def get_yes_no(prompt, default='no'):
     """
@@ -179,3 +181,58 @@ def get_kde_choice():
     """
     choice = get_yes_no("Do you want to include a KDE in the histogram", default='no')
     return choice == 'yes'
+
+def get_raster_options(save_path):
+    """
+    Prompt the user for hybrid raster/vector export settings when saving to a vector format.
+    """
+    options = {}
+    if not save_path or not save_path.lower().endswith(tuple(VECTOR_FORMATS)):
+        return options
+    raster_choice = get_yes_no("Do you want to rasterize dense data layers to keep the file small", default='yes')
+    if raster_choice == 'yes':
+        options['rasterize_threshold'] = get_positive_integer(
+            "Enter the element count above which a data layer is rasterized", default=10000
+        )
+        options['raster_dpi'] = get_positive_integer("Enter the raster DPI", default=300)
+    else:
+        options['rasterize_threshold'] = None
+    return options
+
+def get_interval(prompt, default=None):
+    """
+    Prompt the user for a positive time interval (e.g. 5min, 1h) with validation.
+    """
+    while True:
+        value = get_input_with_default(prompt, default=default)
+        try:
+            float(value)
+            print("Please include a unit, e.g. 5s or 5min.")
+            continue
+        except ValueError:
+            pass
+        try:
+            if pd.to_timedelta(value).value > 0:
+                return value
+            print("Please enter a positive interval.")
+        except ValueError:
+            print("Invalid interval. Please enter a value such as 1s, 5min, 1h or 1D.")
+
+def get_time_series_options():
+    """
+    Prompt the user for time-series parsing, resampling and rolling-statistics settings.
+    Returns None if the X column is not a timestamp column.
+    """
+    ts_choice = get_yes_no("Is the X column a timestamp (ISO date or epoch)", default='no')
+    if ts_choice == 'no':
+        return None
+    options = {}
+    resample_choice = get_yes_no("Do you want to resample to a fixed interval", default='no')
+    if resample_choice == 'yes':
+        options['interval'] = get_interval("Enter the interval (e.g. 1s, 5min, 1h, 1D)", default='1min')
+        options['how'] = get_graph_type("Enter the aggregation", ['mean', 'min', 'max', 'count'], default='mean')
+    rolling_choice = get_yes_no("Do you want to add rolling statistics", default='no')
+    if rolling_choice == 'yes':
+        options['window'] = get_positive_integer("Enter the rolling window size in samples", default=10)
+        options['band'] = get_graph_type("Enter the band type", ['percentile', 'std'], default='percentile')
+    return options